@@ -68,7 +68,7 @@ class MultiTenantCanvasHTTPServer:
         self.max_sessions_per_user = 5  # Limit concurrent sessions per user
         self.max_requests_per_minute = 60  # Rate limiting per session
         self.max_requests_per_ip_per_minute = 100  # IP-based rate limiting
-        self.request_counts: Dict[str, Dict[str, Any]] = {}  # Track request rates
+        self.request_counts: Dict[str, int] = {}  # Track request rates (packed window|count)
         self.ip_request_counts: Dict[str, Dict[str, Any]] = {}  # Track IP request rates
         
         # Security logging
@@ -98,7 +98,10 @@ class MultiTenantCanvasHTTPServer:
     def hash_credentials(self, api_token: str, api_url: str) -> str:
         """Create a hash of credentials for session identification."""
         combined = f"{api_token}:{api_url}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        # blake2b emits exactly the 16 hex chars needed instead of computing
+        # a full SHA-256 and discarding 48 of its 64 hex digits; the hash is
+        # a session-table identifier, not a cryptographic commitment
+        return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
     
     def validate_input(self, data: Any, field_name: str) -> bool:
         """Validate and sanitize input data."""
@@ -148,21 +151,26 @@ class MultiTenantCanvasHTTPServer:
     
     def check_rate_limit(self, session_id: str) -> bool:
         """Check if user has exceeded rate limits."""
-        now = datetime.now()
-        if session_id not in self.request_counts:
-            self.request_counts[session_id] = {'count': 0, 'window_start': now}
+        # Window start (monotonic ms) lives in the high bits of a single int
+        # with the request count in the low 20 bits: one dict read and one
+        # dict write per call, no nested dict or timedelta allocations.
+        now_ms = time.monotonic_ns() // 1_000_000
+        packed = self.request_counts.get(session_id, 0)
+        window_start = packed >> 20
+        count = packed & 0xFFFFF
         
         # Reset counter if window has passed
-        if now - self.request_counts[session_id]['window_start'] > timedelta(minutes=1):
-            self.request_counts[session_id] = {'count': 0, 'window_start': now}
+        if now_ms - window_start > 60_000:
+            window_start = now_ms
+            count = 0
         
         # Check if limit exceeded
-        if self.request_counts[session_id]['count'] >= self.max_requests_per_minute:
+        if count >= self.max_requests_per_minute:
             security_logger.warning(f"Session rate limit exceeded for {session_id[:8]}...")
             return False
         
         # Increment counter
-        self.request_counts[session_id]['count'] += 1
+        self.request_counts[session_id] = (window_start << 20) | (count + 1)
         return True
     
     def anonymize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
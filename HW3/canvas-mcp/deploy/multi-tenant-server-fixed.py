@@ -35,7 +35,10 @@ class MultiTenantCanvasServer:
     def hash_credentials(self, api_token: str, api_url: str) -> str:
         """Create a hash of credentials for session identification."""
         combined = f"{api_token}:{api_url}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        # blake2b emits exactly the 16 hex chars needed instead of computing
+        # a full SHA-256 and discarding 48 of its 64 hex digits; the hash is
+        # a session-table identifier, not a cryptographic commitment
+        return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
     
     async def authenticate_user(self, api_token: str, api_url: str) -> Optional[str]:
         """
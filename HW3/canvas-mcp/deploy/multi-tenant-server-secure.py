@@ -31,6 +31,205 @@ import re
 
 import httpx
 
+try:
+    import orjson
+    def _frame_loads(data):
+        return orjson.loads(data)
+    def _frame_dumps(obj):
+        return orjson.dumps(obj)  # bytes, written straight to stdout.buffer
+except ImportError:
+    # stdlib fallback - orjson is an optional speedup for the frame loop
+    def _frame_loads(data):
+        return json.loads(data)
+    def _frame_dumps(obj):
+        return json.dumps(obj).encode()
+
+# Static JSON-RPC error templates kept as bytes: the error path does one
+# %-substitution instead of building and encoding a nested dict
+_ERR_METHOD_NOT_FOUND = b'{"jsonrpc":"2.0","id":%s,"error":{"code":-32601,"message":"Method not found"}}\n'
+_ERR_INTERNAL = b'{"jsonrpc":"2.0","id":%s,"error":{"code":-32603,"message":%s}}\n'
+
+def _err(template, request_id, *args):
+    """Fill an error template; ids and messages are JSON-encoded bytes."""
+    values = (_frame_dumps(request_id),) + tuple(_frame_dumps(a) for a in args)
+    return template % values
+
+# The tool schemas never change - build the list once at import time
+_TOOLS_LIST = [
+    {
+        'name': 'authenticate_canvas',
+        'description': 'Authenticate with your Canvas credentials',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'api_token': {'type': 'string', 'description': 'Your Canvas API token'},
+                'api_url': {'type': 'string', 'description': 'Your Canvas API URL'},
+                'institution_name': {'type': 'string', 'description': 'Your institution name (optional)'}
+            },
+            'required': ['api_token', 'api_url']
+        }
+    },
+    {
+        'name': 'get_my_profile',
+        'description': 'Get your Canvas profile information',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'}
+            },
+            'required': ['session_id']
+        }
+    },
+    {
+        'name': 'list_my_courses',
+        'description': 'List courses for the authenticated user',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'include_concluded': {'type': 'boolean', 'description': 'Include concluded courses'}
+            },
+            'required': ['session_id']
+        }
+    },
+    {
+        'name': 'get_course_details',
+        'description': 'Get detailed information about a specific course',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'}
+            },
+            'required': ['session_id', 'course_id']
+        }
+    },
+    {
+        'name': 'list_assignments',
+        'description': 'List assignments for a specific course',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'},
+                'include_concluded': {'type': 'boolean', 'description': 'Include concluded assignments'}
+            },
+            'required': ['session_id', 'course_id']
+        }
+    },
+    {
+        'name': 'get_assignment_details',
+        'description': 'Get detailed information about a specific assignment',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'},
+                'assignment_id': {'type': 'string', 'description': 'Canvas assignment ID'}
+            },
+            'required': ['session_id', 'course_id', 'assignment_id']
+        }
+    },
+    {
+        'name': 'list_discussions',
+        'description': 'List discussions for a specific course',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'},
+                'only_announcements': {'type': 'boolean', 'description': 'Only show announcements'}
+            },
+            'required': ['session_id', 'course_id']
+        }
+    },
+    {
+        'name': 'get_discussion_details',
+        'description': 'Get detailed information about a specific discussion',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'},
+                'discussion_id': {'type': 'string', 'description': 'Canvas discussion ID'}
+            },
+            'required': ['session_id', 'course_id', 'discussion_id']
+        }
+    },
+    {
+        'name': 'list_announcements',
+        'description': 'List announcements for a specific course',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'}
+            },
+            'required': ['session_id', 'course_id']
+        }
+    },
+    {
+        'name': 'get_grades',
+        'description': 'Get your grades for a specific course',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'}
+            },
+            'required': ['session_id', 'course_id']
+        }
+    },
+    {
+        'name': 'list_calendar_events',
+        'description': 'List calendar events for a specific course',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'course_id': {'type': 'string', 'description': 'Canvas course ID'},
+                'start_date': {'type': 'string', 'description': 'Start date (YYYY-MM-DD)'},
+                'end_date': {'type': 'string', 'description': 'End date (YYYY-MM-DD)'}
+            },
+            'required': ['session_id', 'course_id']
+        }
+    },
+    {
+        'name': 'search_courses',
+        'description': 'Search for courses by name or code',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
+                'search_term': {'type': 'string', 'description': 'Search term for course name or code'}
+            },
+            'required': ['session_id', 'search_term']
+        }
+    },
+    {
+        'name': 'get_session_info',
+        'description': 'Get information about your current session',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'}
+            },
+            'required': ['session_id']
+        }
+    },
+    {
+        'name': 'logout',
+        'description': 'Logout and invalidate your session',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'session_id': {'type': 'string', 'description': 'Your session ID from authentication'}
+            },
+            'required': ['session_id']
+        }
+    }
+]
+
 class MultiTenantCanvasServer:
     """Multi-tenant Canvas MCP Server with per-user credential isolation."""
     
@@ -42,7 +241,41 @@ class MultiTenantCanvasServer:
         # Security settings
         self.max_sessions_per_user = 5  # Limit concurrent sessions per user
         self.max_requests_per_minute = 60  # Rate limiting
-        self.request_counts: Dict[str, Dict[str, Any]] = {}  # Track request rates
+        self.request_counts: Dict[str, int] = {}  # Track request rates (packed window|count)
+        
+        # One pooled HTTP client for the life of the server - per-request
+        # clients paid a TCP + TLS handshake on every Canvas call
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+        )
+        self._stdout_lock = asyncio.Lock()  # keeps response framing atomic
+        self._out = sys.stdout.buffer
+        self._inflight_writes = 0  # flush only when the last writer finishes
+        self._resp_cache: Dict[tuple, tuple] = {}  # GET cache: key -> (ts, data)
+        
+        # Dispatch tables for MCP methods and tool names
+        self._methods = {
+            'initialize': self._on_initialize,
+            'tools/list': self._on_tools_list,
+            'tools/call': self._on_tools_call,
+        }
+        self._tools = {
+            'authenticate_canvas': self._tool_authenticate_canvas,
+            'get_my_profile': self._tool_get_my_profile,
+            'list_my_courses': self._tool_list_my_courses,
+            'get_course_details': self._tool_get_course_details,
+            'list_assignments': self._tool_list_assignments,
+            'get_assignment_details': self._tool_get_assignment_details,
+            'list_discussions': self._tool_list_discussions,
+            'get_discussion_details': self._tool_get_discussion_details,
+            'list_announcements': self._tool_list_announcements,
+            'get_grades': self._tool_get_grades,
+            'list_calendar_events': self._tool_list_calendar_events,
+            'search_courses': self._tool_search_courses,
+            'get_session_info': self._tool_get_session_info,
+            'logout': self._tool_logout,
+        }
         
     def generate_session_id(self) -> str:
         """Generate a secure session ID."""
@@ -51,7 +284,10 @@ class MultiTenantCanvasServer:
     def hash_credentials(self, api_token: str, api_url: str) -> str:
         """Create a hash of credentials for session identification."""
         combined = f"{api_token}:{api_url}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        # blake2b emits exactly the 16 hex chars needed instead of computing
+        # a full SHA-256 and discarding 48 of its 64 hex digits; the hash is
+        # a session-table identifier, not a cryptographic commitment
+        return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
     
     def validate_input(self, data: Any, field_name: str) -> bool:
         """Validate and sanitize input data."""
@@ -69,20 +305,25 @@ class MultiTenantCanvasServer:
     
     def check_rate_limit(self, session_id: str) -> bool:
         """Check if user has exceeded rate limits."""
-        now = datetime.now()
-        if session_id not in self.request_counts:
-            self.request_counts[session_id] = {'count': 0, 'window_start': now}
+        # Window start (monotonic ms) lives in the high bits of a single int
+        # with the request count in the low 20 bits: one dict read and one
+        # dict write per call, no nested dict or timedelta allocations.
+        now_ms = time.monotonic_ns() // 1_000_000
+        packed = self.request_counts.get(session_id, 0)
+        window_start = packed >> 20
+        count = packed & 0xFFFFF
         
         # Reset counter if window has passed
-        if now - self.request_counts[session_id]['window_start'] > timedelta(minutes=1):
-            self.request_counts[session_id] = {'count': 0, 'window_start': now}
+        if now_ms - window_start > 60_000:
+            window_start = now_ms
+            count = 0
         
         # Check if limit exceeded
-        if self.request_counts[session_id]['count'] >= self.max_requests_per_minute:
+        if count >= self.max_requests_per_minute:
             return False
         
         # Increment counter
-        self.request_counts[session_id]['count'] += 1
+        self.request_counts[session_id] = (window_start << 20) | (count + 1)
         return True
     
     def anonymize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -132,45 +373,44 @@ class MultiTenantCanvasServer:
                 return None
             
             # Test the credentials by making a simple API call
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{api_url.rstrip('/')}/users/self",
-                    headers={"Authorization": f"Bearer {api_token}"},
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                user_data = response.json()
-                
-                # Check for existing sessions for this user
-                credential_hash = self.hash_credentials(api_token, api_url)
-                existing_sessions = [sid for sid, session in self.user_sessions.items() 
-                                   if session.get('credential_hash') == credential_hash]
-                
-                # Enforce session limit
-                if len(existing_sessions) >= self.max_sessions_per_user:
-                    # Remove oldest session
-                    oldest_session = min(existing_sessions, 
-                                       key=lambda sid: self.user_sessions[sid]['created_at'])
-                    del self.user_sessions[oldest_session]
-                
-                # Create session
-                session_id = self.generate_session_id()
-                
-                self.user_sessions[session_id] = {
-                    "api_token": api_token,
-                    "api_url": api_url,
-                    "user_id": user_data.get("id"),
-                    "user_name": user_data.get("name", "Unknown"),
-                    "credential_hash": credential_hash,
-                    "created_at": datetime.now(),
-                    "last_activity": datetime.now()
-                }
-                
-                # Anonymize user data for logging
-                anonymized_data = self.anonymize_data(user_data)
-                print(f"✅ User authenticated: {anonymized_data.get('name')} ({anonymized_data.get('id')})", file=sys.stderr)
-                return session_id
-                
+            response = await self._client.get(
+                f"{api_url.rstrip('/')}/users/self",
+                headers={"Authorization": f"Bearer {api_token}"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            user_data = response.json()
+            
+            # Check for existing sessions for this user
+            credential_hash = self.hash_credentials(api_token, api_url)
+            existing_sessions = [sid for sid, session in self.user_sessions.items() 
+                               if session.get('credential_hash') == credential_hash]
+            
+            # Enforce session limit
+            if len(existing_sessions) >= self.max_sessions_per_user:
+                # Remove oldest session
+                oldest_session = min(existing_sessions, 
+                                   key=lambda sid: self.user_sessions[sid]['created_at'])
+                self._destroy_session(oldest_session)
+            
+            # Create session
+            session_id = self.generate_session_id()
+            
+            self.user_sessions[session_id] = {
+                "api_token": api_token,
+                "api_url": api_url,
+                "user_id": user_data.get("id"),
+                "user_name": user_data.get("name", "Unknown"),
+                "credential_hash": credential_hash,
+                "created_at": datetime.now(),
+                "last_activity": datetime.now()
+            }
+            
+            # Anonymize user data for logging
+            anonymized_data = self.anonymize_data(user_data)
+            print(f"✅ User authenticated: {anonymized_data.get('name')} ({anonymized_data.get('id')})", file=sys.stderr)
+            return session_id
+            
         except Exception as e:
             sanitized_error = self.sanitize_error_message(str(e))
             print(f"❌ Authentication failed: {sanitized_error}", file=sys.stderr)
@@ -185,7 +425,7 @@ class MultiTenantCanvasServer:
         
         # Check if session is expired
         if datetime.now() - session["last_activity"] > self.session_timeout:
-            del self.user_sessions[session_id]
+            self._destroy_session(session_id)
             return None
         
         # Check rate limiting
@@ -197,6 +437,17 @@ class MultiTenantCanvasServer:
         session["last_activity"] = datetime.now()
         return session
     
+    def _destroy_session(self, session_id: str):
+        """Delete a session plus everything cached or counted on its behalf.
+        
+        The logout message promises data is cleared from memory, so the
+        session's cached Canvas responses must go with it."""
+        self.user_sessions.pop(session_id, None)
+        self.request_counts.pop(session_id, None)
+        stale = [key for key in self._resp_cache if key[2] == session_id]
+        for key in stale:
+            del self._resp_cache[key]
+    
     def cleanup_expired_sessions(self):
         """Remove expired sessions."""
         now = datetime.now()
@@ -206,7 +457,21 @@ class MultiTenantCanvasServer:
         ]
         
         for session_id in expired_sessions:
-            del self.user_sessions[session_id]
+            self._destroy_session(session_id)
+    
+    @staticmethod
+    def _cache_ttl(endpoint: str) -> int:
+        """Cache lifetime for a GET endpoint: course/profile data changes
+        rarely; assignments and the rest get a shorter window."""
+        if endpoint == '/users/self' or endpoint == '/courses' or endpoint.startswith('/courses/') and endpoint.count('/') == 2:
+            return 30
+        return 10
+    
+    def _invalidate(self, endpoint_prefix: str):
+        """Drop cached GET responses under an endpoint prefix after mutations."""
+        stale = [key for key in self._resp_cache if key[0].startswith(endpoint_prefix)]
+        for key in stale:
+            del self._resp_cache[key]
     
     async def make_canvas_request(self, session_id: str, method: str, endpoint: str, **kwargs) -> Any:
         """Make a Canvas API request using the user's credentials."""
@@ -223,342 +488,172 @@ class MultiTenantCanvasServer:
             if kwargs.get("data") and len(str(kwargs["data"])) > 10000:
                 return {"error": "Request too large"}
             
-            async with httpx.AsyncClient() as client:
-                url = f"{session['api_url'].rstrip('/')}{endpoint}"
-                headers = {
-                    "Authorization": f"Bearer {session['api_token']}",
-                    **kwargs.get("headers", {})
-                }
-                
-                if method.lower() == "get":
-                    response = await client.get(url, params=kwargs.get("params"), headers=headers, timeout=30.0)
-                elif method.lower() == "post":
-                    response = await client.post(url, json=kwargs.get("data"), headers=headers, timeout=30.0)
-                elif method.lower() == "put":
-                    response = await client.put(url, json=kwargs.get("data"), headers=headers, timeout=30.0)
-                elif method.lower() == "delete":
-                    response = await client.delete(url, params=kwargs.get("params"), headers=headers, timeout=30.0)
-                else:
-                    return {"error": f"Unsupported method: {method}"}
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Anonymize sensitive data in response
-                if isinstance(data, list):
-                    return [self.anonymize_data(item) if isinstance(item, dict) else item for item in data]
-                elif isinstance(data, dict):
-                    return self.anonymize_data(data)
-                else:
-                    return data
-                
+            # Serve repeated idempotent GETs from the short-TTL cache - MCP
+            # clients re-query courses/profile many times per session
+            is_get = method.lower() == "get"
+            cache_key = None
+            if is_get:
+                params_key = tuple(
+                    (k, tuple(v) if isinstance(v, list) else v)
+                    for k, v in sorted((kwargs.get("params") or {}).items())
+                )
+                cache_key = (endpoint, params_key, session_id)
+                cached = self._resp_cache.get(cache_key)
+                if cached is not None and time.time() - cached[0] < self._cache_ttl(endpoint):
+                    return cached[1]
+            
+            url = f"{session['api_url'].rstrip('/')}{endpoint}"
+            headers = {
+                "Authorization": f"Bearer {session['api_token']}",
+                **kwargs.get("headers", {})
+            }
+            
+            client = self._client
+            if method.lower() == "get":
+                response = await client.get(url, params=kwargs.get("params"), headers=headers, timeout=30.0)
+            elif method.lower() == "post":
+                response = await client.post(url, json=kwargs.get("data"), headers=headers, timeout=30.0)
+            elif method.lower() == "put":
+                response = await client.put(url, json=kwargs.get("data"), headers=headers, timeout=30.0)
+            elif method.lower() == "delete":
+                response = await client.delete(url, params=kwargs.get("params"), headers=headers, timeout=30.0)
+            else:
+                return {"error": f"Unsupported method: {method}"}
+            
+            response.raise_for_status()
+            data = response.json()
+            
+            # Anonymize sensitive data in response
+            if isinstance(data, list):
+                result = [self.anonymize_data(item) if isinstance(item, dict) else item for item in data]
+            elif isinstance(data, dict):
+                result = self.anonymize_data(data)
+            else:
+                result = data
+            
+            if is_get:
+                now_ts = time.time()
+                self._resp_cache[cache_key] = (now_ts, result)
+                # Sweep entries that have outlived their TTL while we're
+                # here, so the cache is bounded by the active working set
+                # instead of growing for the server's lifetime
+                stale = [key for key, (ts, _) in self._resp_cache.items()
+                         if now_ts - ts >= self._cache_ttl(key[0])]
+                for key in stale:
+                    del self._resp_cache[key]
+            else:
+                # Mutations make cached reads under this endpoint stale
+                self._invalidate(endpoint)
+            return result
+            
         except Exception as e:
             sanitized_error = self.sanitize_error_message(str(e))
             return {"error": f"API request failed: {sanitized_error}"}
 
-    def handle_request(self, request):
-        """Handle MCP protocol requests with security validation."""
-        try:
-            data = json.loads(request)
-            method = data.get('method')
-            request_id = data.get('id')
-            params = data.get('params', {})
-            
-            # Handle initialization
-            if method == 'initialize':
-                response = {
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': {
-                        'protocolVersion': '2024-11-05',
-                        'capabilities': {
-                            'tools': {}
-                        },
-                        'serverInfo': {
-                            'name': 'canvas-mcp-multi-tenant',
-                            'version': '1.0.0'
-                        }
-                    }
-                }
-            # Handle tools/list
-            elif method == 'tools/list':
-                response = {
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': {
-                        'tools': [
-                            {
-                                'name': 'authenticate_canvas',
-                                'description': 'Authenticate with your Canvas credentials',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'api_token': {'type': 'string', 'description': 'Your Canvas API token'},
-                                        'api_url': {'type': 'string', 'description': 'Your Canvas API URL'},
-                                        'institution_name': {'type': 'string', 'description': 'Your institution name (optional)'}
-                                    },
-                                    'required': ['api_token', 'api_url']
-                                }
-                            },
-                            {
-                                'name': 'get_my_profile',
-                                'description': 'Get your Canvas profile information',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'}
-                                    },
-                                    'required': ['session_id']
-                                }
-                            },
-                            {
-                                'name': 'list_my_courses',
-                                'description': 'List courses for the authenticated user',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'include_concluded': {'type': 'boolean', 'description': 'Include concluded courses'}
-                                    },
-                                    'required': ['session_id']
-                                }
-                            },
-                            {
-                                'name': 'get_course_details',
-                                'description': 'Get detailed information about a specific course',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'}
-                                    },
-                                    'required': ['session_id', 'course_id']
-                                }
-                            },
-                            {
-                                'name': 'list_assignments',
-                                'description': 'List assignments for a specific course',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'},
-                                        'include_concluded': {'type': 'boolean', 'description': 'Include concluded assignments'}
-                                    },
-                                    'required': ['session_id', 'course_id']
-                                }
-                            },
-                            {
-                                'name': 'get_assignment_details',
-                                'description': 'Get detailed information about a specific assignment',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'},
-                                        'assignment_id': {'type': 'string', 'description': 'Canvas assignment ID'}
-                                    },
-                                    'required': ['session_id', 'course_id', 'assignment_id']
-                                }
-                            },
-                            {
-                                'name': 'list_discussions',
-                                'description': 'List discussions for a specific course',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'},
-                                        'only_announcements': {'type': 'boolean', 'description': 'Only show announcements'}
-                                    },
-                                    'required': ['session_id', 'course_id']
-                                }
-                            },
-                            {
-                                'name': 'get_discussion_details',
-                                'description': 'Get detailed information about a specific discussion',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'},
-                                        'discussion_id': {'type': 'string', 'description': 'Canvas discussion ID'}
-                                    },
-                                    'required': ['session_id', 'course_id', 'discussion_id']
-                                }
-                            },
-                            {
-                                'name': 'list_announcements',
-                                'description': 'List announcements for a specific course',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'}
-                                    },
-                                    'required': ['session_id', 'course_id']
-                                }
-                            },
-                            {
-                                'name': 'get_grades',
-                                'description': 'Get your grades for a specific course',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'}
-                                    },
-                                    'required': ['session_id', 'course_id']
-                                }
-                            },
-                            {
-                                'name': 'list_calendar_events',
-                                'description': 'List calendar events for a specific course',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'course_id': {'type': 'string', 'description': 'Canvas course ID'},
-                                        'start_date': {'type': 'string', 'description': 'Start date (YYYY-MM-DD)'},
-                                        'end_date': {'type': 'string', 'description': 'End date (YYYY-MM-DD)'}
-                                    },
-                                    'required': ['session_id', 'course_id']
-                                }
-                            },
-                            {
-                                'name': 'search_courses',
-                                'description': 'Search for courses by name or code',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'},
-                                        'search_term': {'type': 'string', 'description': 'Search term for course name or code'}
-                                    },
-                                    'required': ['session_id', 'search_term']
-                                }
-                            },
-                            {
-                                'name': 'get_session_info',
-                                'description': 'Get information about your current session',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'}
-                                    },
-                                    'required': ['session_id']
-                                }
-                            },
-                            {
-                                'name': 'logout',
-                                'description': 'Logout and invalidate your session',
-                                'inputSchema': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'session_id': {'type': 'string', 'description': 'Your session ID from authentication'}
-                                    },
-                                    'required': ['session_id']
-                                }
-                            }
-                        ]
+    @staticmethod
+    def _text_response(request_id, text):
+        """Wrap tool output in the standard JSON-RPC content envelope."""
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': text
                     }
+                ]
+            }
+        }
+
+    async def _on_initialize(self, params, request_id):
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': {
+                'protocolVersion': '2024-11-05',
+                'capabilities': {
+                    'tools': {}
+                },
+                'serverInfo': {
+                    'name': 'canvas-mcp-multi-tenant',
+                    'version': '1.0.0'
                 }
-            # Handle tools/call
-            elif method == 'tools/call':
-                tool_name = params.get('name')
-                arguments = params.get('arguments', {})
-                
-                # Run async function in sync context
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    if tool_name == 'authenticate_canvas':
-                        api_token = arguments.get('api_token')
-                        api_url = arguments.get('api_url')
-                        institution_name = arguments.get('institution_name', '')
-                        
-                        session_id = loop.run_until_complete(self.authenticate_user(api_token, api_url))
-                        if session_id:
-                            session = self.user_sessions[session_id]
-                            result = {
-                                'session_id': session_id,
-                                'user_name': session['user_name'],
-                                'user_id': session['user_id'],
-                                'institution': institution_name,
-                                'message': '✅ Successfully authenticated with Canvas!'
-                            }
-                            response = {
-                                'jsonrpc': '2.0',
-                                'id': request_id,
-                                'result': {
-                                    'content': [
-                                        {
-                                            'type': 'text',
-                                            'text': json.dumps(result, indent=2)
-                                        }
-                                    ]
-                                }
-                            }
-                        else:
-                            response = {
-                                'jsonrpc': '2.0',
-                                'id': request_id,
-                                'result': {
-                                    'content': [
-                                        {
-                                            'type': 'text',
-                                            'text': json.dumps({'error': '❌ Authentication failed. Please check your credentials.'}, indent=2)
-                                        }
-                                    ]
-                                }
-                            }
-                    
-                    elif tool_name == 'get_my_profile':
-                        session_id = arguments.get('session_id')
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', '/users/self'))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        else:
-                            profile = f'''
+            }
+        }
+
+    async def _on_tools_list(self, params, request_id):
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': {
+                'tools': _TOOLS_LIST
+            }
+        }
+
+    async def _on_tools_call(self, params, request_id):
+        tool_name = params.get('name')
+        arguments = params.get('arguments', {})
+        
+        handler = self._tools.get(tool_name)
+        if handler is None:
+            return self._text_response(request_id, 'Unknown tool')
+        return await handler(arguments, request_id)
+
+    async def _tool_authenticate_canvas(self, arguments, request_id):
+        api_token = arguments.get('api_token')
+        api_url = arguments.get('api_url')
+        institution_name = arguments.get('institution_name', '')
+        
+        session_id = await self.authenticate_user(api_token, api_url)
+        if session_id:
+            session = self.user_sessions[session_id]
+            result = {
+                'session_id': session_id,
+                'user_name': session['user_name'],
+                'user_id': session['user_id'],
+                'institution': institution_name,
+                'message': '✅ Successfully authenticated with Canvas!'
+            }
+            return self._text_response(request_id, json.dumps(result, indent=2))
+        return self._text_response(request_id, json.dumps({'error': '❌ Authentication failed. Please check your credentials.'}, indent=2))
+
+    async def _tool_get_my_profile(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        response_data = await self.make_canvas_request(session_id, 'get', '/users/self')
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        else:
+            profile = f'''
 Name: {response_data.get('name', 'N/A')}
 Email: {response_data.get('email', 'N/A')}
 ID: {response_data.get('id', 'N/A')}
 Login ID: {response_data.get('login_id', 'N/A')}
 Created: {response_data.get('created_at', 'N/A')}
 '''
-                            result_text = profile
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'list_my_courses':
-                        session_id = arguments.get('session_id')
-                        include_concluded = arguments.get('include_concluded', False)
-                        
-                        params_dict = {'include[]': ['term', 'teachers', 'total_students'], 'per_page': 100}
-                        if include_concluded:
-                            params_dict['state[]'] = ['available', 'completed']
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', '/courses', params=params_dict))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        elif not response_data:
-                            result_text = 'No courses found.'
-                        else:
-                            courses_info = []
-                            for course in response_data:
-                                course_info = f'''
+            result_text = profile
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_list_my_courses(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        include_concluded = arguments.get('include_concluded', False)
+
+        params_dict = {'include[]': ['term', 'teachers', 'total_students'], 'per_page': 100}
+        if include_concluded:
+            params_dict['state[]'] = ['available', 'completed']
+
+        response_data = await self.make_canvas_request(session_id, 'get', '/courses', params=params_dict)
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        elif not response_data:
+            result_text = 'No courses found.'
+        else:
+            courses_info = []
+            for course in response_data:
+                course_info = f'''
 Course: {course.get('name', 'Unnamed')}
 ID: {course.get('id')}
 Code: {course.get('course_code', 'N/A')}
@@ -566,33 +661,22 @@ Term: {course.get('term', {}).get('name', 'N/A')}
 Students: {course.get('total_students', 0)}
 Status: {course.get('workflow_state', 'Unknown')}
 '''
-                                courses_info.append(course_info)
-                            result_text = '\n'.join(courses_info)
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'get_course_details':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}'))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        else:
-                            course = response_data
-                            course_details = f'''
+                courses_info.append(course_info)
+            result_text = '\n'.join(courses_info)
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_get_course_details(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}')
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        else:
+            course = response_data
+            course_details = f'''
 Course: {course.get('name', 'Unnamed')}
 ID: {course.get('id')}
 Code: {course.get('course_code', 'N/A')}
@@ -602,77 +686,55 @@ End Date: {course.get('end_at', 'N/A')}
 Status: {course.get('workflow_state', 'Unknown')}
 Description: {course.get('public_description', 'No description available')}
 '''
-                            result_text = course_details
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'list_assignments':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        include_concluded = arguments.get('include_concluded', False)
-                        
-                        params_dict = {
-                            'per_page': 100,
-                            'include[]': ['all_dates', 'submission']
-                        }
-                        if include_concluded:
-                            params_dict['state[]'] = ['available', 'completed']
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/assignments', params=params_dict))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        elif not response_data:
-                            result_text = f'No assignments found for course {course_id}.'
-                        else:
-                            assignments_info = []
-                            for assignment in response_data:
-                                assignment_info = f'''
+            result_text = course_details
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_list_assignments(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+        include_concluded = arguments.get('include_concluded', False)
+
+        params_dict = {
+            'per_page': 100,
+            'include[]': ['all_dates', 'submission']
+        }
+        if include_concluded:
+            params_dict['state[]'] = ['available', 'completed']
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/assignments', params=params_dict)
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        elif not response_data:
+            result_text = f'No assignments found for course {course_id}.'
+        else:
+            assignments_info = []
+            for assignment in response_data:
+                assignment_info = f'''
 Assignment: {assignment.get('name', 'Unnamed')}
 ID: {assignment.get('id')}
 Due: {assignment.get('due_at', 'No due date')}
 Points: {assignment.get('points_possible', 0)}
 Status: {assignment.get('submission', {}).get('workflow_state', 'Not submitted')}
 '''
-                                assignments_info.append(assignment_info)
-                            result_text = '\n'.join(assignments_info)
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'get_assignment_details':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        assignment_id = arguments.get('assignment_id')
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/assignments/{assignment_id}'))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        else:
-                            assignment = response_data
-                            assignment_details = f'''
+                assignments_info.append(assignment_info)
+            result_text = '\n'.join(assignments_info)
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_get_assignment_details(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+        assignment_id = arguments.get('assignment_id')
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/assignments/{assignment_id}')
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        else:
+            assignment = response_data
+            assignment_details = f'''
 Assignment: {assignment.get('name', 'Unnamed')}
 ID: {assignment.get('id')}
 Due: {assignment.get('due_at', 'No due date')}
@@ -680,359 +742,272 @@ Points: {assignment.get('points_possible', 0)}
 Description: {assignment.get('description', 'No description available')}
 Status: {assignment.get('submission', {}).get('workflow_state', 'Not submitted')}
 '''
-                            result_text = assignment_details
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'list_discussions':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        only_announcements = arguments.get('only_announcements', False)
-                        
-                        params_dict = {'per_page': 100}
-                        if only_announcements:
-                            params_dict['only_announcements'] = True
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/discussion_topics', params=params_dict))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        elif not response_data:
-                            result_text = f'No discussions found for course {course_id}.'
-                        else:
-                            discussions_info = []
-                            for discussion in response_data:
-                                discussion_info = f'''
+            result_text = assignment_details
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_list_discussions(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+        only_announcements = arguments.get('only_announcements', False)
+
+        params_dict = {'per_page': 100}
+        if only_announcements:
+            params_dict['only_announcements'] = True
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/discussion_topics', params=params_dict)
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        elif not response_data:
+            result_text = f'No discussions found for course {course_id}.'
+        else:
+            discussions_info = []
+            for discussion in response_data:
+                discussion_info = f'''
 Discussion: {discussion.get('title', 'Unnamed')}
 ID: {discussion.get('id')}
 Posted: {discussion.get('posted_at', 'N/A')}
 Author: {discussion.get('author', {}).get('display_name', 'Unknown')}
 '''
-                                discussions_info.append(discussion_info)
-                            result_text = '\n'.join(discussions_info)
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'get_discussion_details':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        discussion_id = arguments.get('discussion_id')
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/discussion_topics/{discussion_id}'))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        else:
-                            discussion = response_data
-                            discussion_details = f'''
+                discussions_info.append(discussion_info)
+            result_text = '\n'.join(discussions_info)
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_get_discussion_details(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+        discussion_id = arguments.get('discussion_id')
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/discussion_topics/{discussion_id}')
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        else:
+            discussion = response_data
+            discussion_details = f'''
 Discussion: {discussion.get('title', 'Unnamed')}
 ID: {discussion.get('id')}
 Posted: {discussion.get('posted_at', 'N/A')}
 Author: {discussion.get('author', {}).get('display_name', 'Unknown')}
 Message: {discussion.get('message', 'No message available')}
 '''
-                            result_text = discussion_details
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'list_announcements':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/discussion_topics', params={'only_announcements': True, 'per_page': 100}))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        elif not response_data:
-                            result_text = f'No announcements found for course {course_id}.'
-                        else:
-                            announcements_info = []
-                            for announcement in response_data:
-                                announcement_info = f'''
+            result_text = discussion_details
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_list_announcements(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/discussion_topics', params={'only_announcements': True, 'per_page': 100})
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        elif not response_data:
+            result_text = f'No announcements found for course {course_id}.'
+        else:
+            announcements_info = []
+            for announcement in response_data:
+                announcement_info = f'''
 Announcement: {announcement.get('title', 'Unnamed')}
 ID: {announcement.get('id')}
 Posted: {announcement.get('posted_at', 'N/A')}
 Author: {announcement.get('author', {}).get('display_name', 'Unknown')}
 '''
-                                announcements_info.append(announcement_info)
-                            result_text = '\n'.join(announcements_info)
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'get_grades':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/enrollments'))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        else:
-                            grades_info = []
-                            for enrollment in response_data:
-                                if enrollment.get('type') == 'StudentEnrollment':
-                                    grades_info.append(f'''
+                announcements_info.append(announcement_info)
+            result_text = '\n'.join(announcements_info)
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_get_grades(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/enrollments')
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        else:
+            grades_info = []
+            for enrollment in response_data:
+                if enrollment.get('type') == 'StudentEnrollment':
+                    grades_info.append(f'''
 Course: {enrollment.get('course_id')}
 Grade: {enrollment.get('grades', {}).get('current_grade', 'N/A')}
 Score: {enrollment.get('grades', {}).get('current_score', 'N/A')}
 Status: {enrollment.get('enrollment_state', 'Unknown')}
 ''')
-                            result_text = '\n'.join(grades_info) if grades_info else 'No grade information available.'
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'list_calendar_events':
-                        session_id = arguments.get('session_id')
-                        course_id = arguments.get('course_id')
-                        start_date = arguments.get('start_date')
-                        end_date = arguments.get('end_date')
-                        
-                        params_dict = {'per_page': 100}
-                        if start_date:
-                            params_dict['start_date'] = start_date
-                        if end_date:
-                            params_dict['end_date'] = end_date
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/calendar_events', params=params_dict))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        elif not response_data:
-                            result_text = f'No calendar events found for course {course_id}.'
-                        else:
-                            events_info = []
-                            for event in response_data:
-                                event_info = f'''
+            result_text = '\n'.join(grades_info) if grades_info else 'No grade information available.'
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_list_calendar_events(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        course_id = arguments.get('course_id')
+        start_date = arguments.get('start_date')
+        end_date = arguments.get('end_date')
+
+        params_dict = {'per_page': 100}
+        if start_date:
+            params_dict['start_date'] = start_date
+        if end_date:
+            params_dict['end_date'] = end_date
+
+        response_data = await self.make_canvas_request(session_id, 'get', f'/courses/{course_id}/calendar_events', params=params_dict)
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        elif not response_data:
+            result_text = f'No calendar events found for course {course_id}.'
+        else:
+            events_info = []
+            for event in response_data:
+                event_info = f'''
 Event: {event.get('title', 'Unnamed')}
 ID: {event.get('id')}
 Start: {event.get('start_at', 'N/A')}
 End: {event.get('end_at', 'N/A')}
 Description: {event.get('description', 'No description available')}
 '''
-                                events_info.append(event_info)
-                            result_text = '\n'.join(events_info)
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'search_courses':
-                        session_id = arguments.get('session_id')
-                        search_term = arguments.get('search_term')
-                        
-                        response_data = loop.run_until_complete(self.make_canvas_request(session_id, 'get', '/courses', params={'search': search_term, 'per_page': 100}))
-                        
-                        if 'error' in response_data:
-                            result_text = f'Error: {response_data["error"]}'
-                        elif not response_data:
-                            result_text = f'No courses found matching "{search_term}".'
-                        else:
-                            courses_info = []
-                            for course in response_data:
-                                course_info = f'''
+                events_info.append(event_info)
+            result_text = '\n'.join(events_info)
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_search_courses(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        search_term = arguments.get('search_term')
+
+        response_data = await self.make_canvas_request(session_id, 'get', '/courses', params={'search': search_term, 'per_page': 100})
+
+        if 'error' in response_data:
+            result_text = f'Error: {response_data["error"]}'
+        elif not response_data:
+            result_text = f'No courses found matching "{search_term}".'
+        else:
+            courses_info = []
+            for course in response_data:
+                course_info = f'''
 Course: {course.get('name', 'Unnamed')}
 ID: {course.get('id')}
 Code: {course.get('course_code', 'N/A')}
 Term: {course.get('term', {}).get('name', 'N/A')}
 '''
-                                courses_info.append(course_info)
-                            result_text = '\n'.join(courses_info)
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'get_session_info':
-                        session_id = arguments.get('session_id')
-                        session = self.get_user_session(session_id)
-                        
-                        if not session:
-                            result_text = '❌ Invalid or expired session. Please re-authenticate.'
-                        else:
-                            info = f'''
+                courses_info.append(course_info)
+            result_text = '\n'.join(courses_info)
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_get_session_info(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+        session = self.get_user_session(session_id)
+
+        if not session:
+            result_text = '❌ Invalid or expired session. Please re-authenticate.'
+        else:
+            info = f'''
 Session ID: {session_id}
 User: {session['user_name']} (ID: {session['user_id']})
 Canvas URL: {session['api_url']}
 Created: {session['created_at'].strftime('%Y-%m-%d %H:%M:%S')}
 Last Activity: {session['last_activity'].strftime('%Y-%m-%d %H:%M:%S')}
 '''
-                            result_text = info
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    elif tool_name == 'logout':
-                        session_id = arguments.get('session_id')
-                        
-                        if session_id in self.user_sessions:
-                            user_name = self.user_sessions[session_id]['user_name']
-                            del self.user_sessions[session_id]
-                            result_text = f'✅ Successfully logged out {user_name}'
-                        else:
-                            result_text = '❌ Session not found or already expired'
-                        
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': result_text
-                                    }
-                                ]
-                            }
-                        }
-                    
-                    else:
-                        response = {
-                            'jsonrpc': '2.0',
-                            'id': request_id,
-                            'result': {
-                                'content': [
-                                    {
-                                        'type': 'text',
-                                        'text': 'Unknown tool'
-                                    }
-                                ]
-                            }
-                        }
-                
-                finally:
-                    loop.close()
+            result_text = info
+
+        return self._text_response(request_id, result_text)
+
+    async def _tool_logout(self, arguments, request_id):
+        session_id = arguments.get('session_id')
+
+        if session_id in self.user_sessions:
+            user_name = self.user_sessions[session_id]['user_name']
+            self._destroy_session(session_id)
+            result_text = f'✅ Successfully logged out {user_name}'
+        else:
+            result_text = '❌ Session not found or already expired'
+
+        return self._text_response(request_id, result_text)
+
+    async def handle_request(self, request):
+        """Handle MCP protocol requests with security validation."""
+        try:
+            data = _frame_loads(request)
+            method = data.get('method')
+            request_id = data.get('id')
+            params = data.get('params', {})
             
             # Handle notification (no response needed)
-            elif method == 'notifications/initialized':
-                return None  # Don't send response for notifications
-            # Handle unknown methods
-            else:
-                response = {
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'error': {
-                        'code': -32601,
-                        'message': 'Method not found'
-                    }
-                }
+            if method == 'notifications/initialized':
+                return None
             
-            return json.dumps(response) + '\n'
+            # O(1) dispatch instead of walking an if/elif ladder per frame
+            handler = self._methods.get(method)
+            if handler is None:
+                return _err(_ERR_METHOD_NOT_FOUND, request_id)
+
+            response = await handler(params, request_id)
+            return _frame_dumps(response) + b'\n'
         except Exception as e:
-            return json.dumps({
-                'jsonrpc': '2.0',
-                'id': data.get('id') if 'data' in locals() else None,
-                'error': {
-                    'code': -32603,
-                    'message': str(e)
-                }
-            }) + '\n'
+            return _err(_ERR_INTERNAL,
+                        data.get('id') if 'data' in locals() else None,
+                        str(e))
+
+    async def _handle_and_write(self, line: str):
+        """Handle one MCP frame and write its response with atomic framing."""
+        response = await self.handle_request(line.strip())
+        if response:  # Only send response if not None
+            self._inflight_writes += 1
+            async with self._stdout_lock:
+                self._out.write(response)
+                self._inflight_writes -= 1
+                # Batch the flush: when several responses are queued behind
+                # the lock, only the last one pays the syscall
+                if self._inflight_writes == 0:
+                    self._out.flush()
 
-    def main(self):
+    async def run(self):
         """Run the multi-tenant MCP server."""
         print(f"🚀 Starting Multi-Tenant Canvas MCP Server...", file=sys.stderr)
         print(f"🔐 Each user must authenticate with their own Canvas credentials", file=sys.stderr)
         print(f"⏰ Session timeout: {self.session_timeout}", file=sys.stderr)
         print(f"🛡️ Security features: Rate limiting, input validation, data anonymization", file=sys.stderr)
         
+        # Async stdin: each frame is handled as its own task, so several
+        # in-flight Canvas calls overlap instead of serializing per request
+        loop = asyncio.get_running_loop()
+        # Default StreamReader limit is 64 KiB and readline() raises beyond
+        # it; blocking sys.stdin.readline() had no such cap, so keep frames
+        # of any realistic size working
+        reader = asyncio.StreamReader(limit=2**24)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        
+        pending = set()
         try:
             while True:
-                line = sys.stdin.readline()
+                line = await reader.readline()
                 if not line:
                     break
                 
-                response = self.handle_request(line.strip())
-                if response:  # Only send response if not None
-                    sys.stdout.write(response)
-                    sys.stdout.flush()
-                
+                task = asyncio.create_task(self._handle_and_write(line.decode()))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         except KeyboardInterrupt:
             print("\n🛑 Server stopped", file=sys.stderr)
         except Exception as e:
             print(f"❌ Server error: {e}", file=sys.stderr)
             sys.exit(1)
+        finally:
+            # Release pooled connections
+            await self._client.aclose()
 
 if __name__ == "__main__":
     server = MultiTenantCanvasServer()
-    server.main()
+    try:
+        asyncio.run(server.run())
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped", file=sys.stderr)
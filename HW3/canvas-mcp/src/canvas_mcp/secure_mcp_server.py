@@ -6,64 +6,100 @@ Enterprise-grade security with FERPA compliance
 
 import sys
 import os
+import re
 import json
 import asyncio
+import ssl
 import httpx
 import secrets
-import hashlib
 import uuid
 import time
+import heapq
 from datetime import datetime, timedelta
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from mcp.server.fastmcp import FastMCP
 from mcp.types import Tool, TextContent
 from typing import Dict, Optional
-import threading
-import gc
+
+try:
+    import orjson
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    # orjson is optional - fall back to the stdlib parser
+    def _json_loads(data):
+        return json.loads(data)
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Canvas tokens typically start with numbers - a digit in the first 5 chars
+_TOKEN_RE = re.compile(r'^.{0,4}\d')
+
 class SecureSessionManager:
     """Secure session management with isolation and encryption."""
     
     def __init__(self):
         self.sessions: Dict[str, Dict] = {}
-        self.session_lock = threading.Lock()
         self.cleanup_interval = 300  # 5 minutes
         self.max_session_age = 3600  # 1 hour
-        self._start_cleanup_thread()
+        self.current_session_id: Optional[str] = None
+        self.expiry_heap = []  # (expiry_ts, session_id), ordered by expiry
+        self._cleanup_task = None
+    
+    def _ensure_cleanup_task(self):
+        """Start the periodic cleanup task on the running event loop."""
+        # All session access happens on the event-loop thread, so no lock is
+        # needed; the old background thread was the only other mutator.
+        if self._cleanup_task is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._cleanup_task = loop.create_task(self._periodic_cleanup())
     
-    def _start_cleanup_thread(self):
-        """Start background cleanup thread."""
-        def cleanup_worker():
-            while True:
-                time.sleep(self.cleanup_interval)
-                self._cleanup_expired_sessions()
-        
-        cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-        cleanup_thread.start()
+    async def _periodic_cleanup(self):
+        """Periodically clean up expired sessions."""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            self._cleanup_expired_sessions()
     
     def _cleanup_expired_sessions(self):
         """Clean up expired sessions."""
+        # The heap is ordered by expiry time, so the sweep only touches
+        # entries that have actually expired instead of scanning every
+        # session each interval
         current_time = time.time()
-        with self.session_lock:
-            expired_sessions = [
-                session_id for session_id, session_data in self.sessions.items()
-                if current_time - session_data['created_at'] > self.max_session_age
-            ]
-            for session_id in expired_sessions:
+        while self.expiry_heap and self.expiry_heap[0][0] <= current_time:
+            _, session_id = heapq.heappop(self.expiry_heap)
+            if session_id in self.sessions:
                 self._destroy_session(session_id)
     
     def create_session(self) -> str:
         """Create a new secure session."""
         session_id = str(uuid.uuid4())
-        with self.session_lock:
-            self.sessions[session_id] = {
-                'config': None,
-                'session_key': secrets.token_hex(32),
-                'created_at': time.time(),
-                'last_activity': time.time()
-            }
+        session_key = secrets.token_hex(32)
+        # session_key is already 256 bits of CSPRNG output, so there is no
+        # low-entropy password to stretch - a single HKDF expansion replaces
+        # the 100k-iteration PBKDF2.
+        derived_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=b'canvas_salt',
+            info=b'token_enc'
+        ).derive(bytes.fromhex(session_key))
+        self._ensure_cleanup_task()
+        created_at = time.time()
+        self.sessions[session_id] = {
+            'config': None,
+            'session_key': session_key,
+            'aesgcm': AESGCM(derived_key[:32]),
+            'created_at': created_at,
+            'last_activity': created_at
+        }
+        heapq.heappush(self.expiry_heap, (created_at + self.max_session_age, session_id))
         return session_id
     
     def _destroy_session(self, session_id: str):
@@ -74,83 +110,98 @@ class SecureSessionManager:
             if session_data['config']:
                 session_data['config'] = None
             del self.sessions[session_id]
-            gc.collect()
+            if self.current_session_id == session_id:
+                self.current_session_id = None
     
     def destroy_session(self, session_id: str):
         """Securely destroy a session."""
-        with self.session_lock:
-            self._destroy_session(session_id)
+        self._destroy_session(session_id)
     
     def get_session(self, session_id: str) -> Optional[Dict]:
         """Get session data."""
-        with self.session_lock:
-            if session_id in self.sessions:
-                self.sessions[session_id]['last_activity'] = time.time()
-                return self.sessions[session_id]
-            return None
+        if session_id in self.sessions:
+            self.sessions[session_id]['last_activity'] = time.time()
+            return self.sessions[session_id]
+        return None
     
     def update_session(self, session_id: str, config: Dict):
         """Update session with encrypted config."""
-        with self.session_lock:
-            if session_id in self.sessions:
-                self.sessions[session_id]['config'] = config
-                self.sessions[session_id]['last_activity'] = time.time()
+        if session_id in self.sessions:
+            self.sessions[session_id]['config'] = config
+            self.sessions[session_id]['last_activity'] = time.time()
+            # Track the most recently authenticated session so tools can
+            # find it without scanning the whole session table
+            self.current_session_id = session_id
 
 class SecureTokenManager:
     """Secure token encryption and management."""
     
     @staticmethod
-    def encrypt_token(token: str, session_key: str) -> str:
-        """Encrypt token using session-specific key."""
-        # Use HMAC-based encryption for better security
-        key = hashlib.pbkdf2_hmac('sha256', session_key.encode(), b'canvas_salt', 100000)
-        # Simple XOR with key expansion for token length
-        key_bytes = (key * (len(token) // len(key) + 1))[:len(token)]
-        encrypted = bytes(a ^ b for a, b in zip(token.encode(), key_bytes))
-        return encrypted.hex()
-    
+    def encrypt_token(token: str, aesgcm: AESGCM) -> str:
+        """Encrypt token with the session's AES-GCM key."""
+        # AES-GCM gives authenticated encryption on the AES-NI hardware path,
+        # replacing the Python-level XOR stream
+        nonce = os.urandom(12)
+        ciphertext = aesgcm.encrypt(nonce, token.encode(), None)
+        return (nonce + ciphertext).hex()
+
     @staticmethod
-    def decrypt_token(encrypted_token: str, session_key: str) -> str:
-        """Decrypt token using session-specific key."""
-        key = hashlib.pbkdf2_hmac('sha256', session_key.encode(), b'canvas_salt', 100000)
-        encrypted_bytes = bytes.fromhex(encrypted_token)
-        key_bytes = (key * (len(encrypted_bytes) // len(key) + 1))[:len(encrypted_bytes)]
-        decrypted = bytes(a ^ b for a, b in zip(encrypted_bytes, key_bytes))
-        return decrypted.decode()
+    def decrypt_token(encrypted_token: str, aesgcm: AESGCM) -> str:
+        """Decrypt token with the session's AES-GCM key."""
+        raw = bytes.fromhex(encrypted_token)
+        return aesgcm.decrypt(raw[:12], raw[12:], None).decode()
     
     @staticmethod
     def validate_token_format(token: str) -> bool:
         """Validate Canvas API token format."""
-        if not token or len(token) < 10:
-            return False
-        # Canvas tokens typically start with numbers and contain ~
-        if not any(c.isdigit() for c in token[:5]):
-            return False
-        return True
+        # Single C-level regex scan instead of a per-character generator
+        return bool(token) and len(token) >= 10 and _TOKEN_RE.match(token) is not None
 
 class SecureCanvasClient:
     """Secure Canvas API client with proper SSL and validation."""
     
+    # Shared secure SSL context - building one loads the system CA bundle
+    # from disk, so do it once at class definition time
+    _SSL_CONTEXT = httpx.create_ssl_context()
+    _SSL_CONTEXT.check_hostname = True
+    _SSL_CONTEXT.verify_mode = ssl.CERT_REQUIRED
+    
     def __init__(self):
         self.rate_limits = {}
         self.max_requests_per_minute = 60
+        # Pooled client: keep-alive connections avoid a TCP + TLS handshake
+        # on every Canvas request
+        self._client = httpx.AsyncClient(
+            verify=SecureCanvasClient._SSL_CONTEXT,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+        )
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
     
     def _check_rate_limit(self, session_id: str) -> bool:
-        """Check rate limiting for session."""
-        current_time = time.time()
-        if session_id not in self.rate_limits:
-            self.rate_limits[session_id] = []
-        
-        # Remove requests older than 1 minute
-        self.rate_limits[session_id] = [
-            req_time for req_time in self.rate_limits[session_id]
-            if current_time - req_time < 60
-        ]
-        
-        if len(self.rate_limits[session_id]) >= self.max_requests_per_minute:
+        """Check rate limiting for session using a token bucket."""
+        # O(1) per call: refill tokens based on elapsed time instead of
+        # filtering the full per-minute request history on every request
+        now = time.time()
+        bucket = self.rate_limits.get(session_id)
+        if bucket is None:
+            bucket = {'tokens': float(self.max_requests_per_minute), 'last': now}
+            self.rate_limits[session_id] = bucket
+
+        # Refill at max_requests_per_minute tokens per minute
+        bucket['tokens'] = min(
+            float(self.max_requests_per_minute),
+            bucket['tokens'] + (now - bucket['last']) * (self.max_requests_per_minute / 60.0)
+        )
+        bucket['last'] = now
+
+        if bucket['tokens'] < 1.0:
             return False
-        
-        self.rate_limits[session_id].append(current_time)
+
+        bucket['tokens'] -= 1.0
         return True
     
     async def make_canvas_request(self, endpoint: str, session_id: str, session_manager: SecureSessionManager, params: dict = None) -> dict:
@@ -166,7 +217,7 @@ class SecureCanvasClient:
         # Decrypt token
         decrypted_token = SecureTokenManager.decrypt_token(
             session['config']['encrypted_token'],
-            session['session_key']
+            session['aesgcm']
         )
         
         if not decrypted_token:
@@ -178,29 +229,28 @@ class SecureCanvasClient:
             "User-Agent": "Canvas-MCP-Secure/1.0"
         }
         
-        url = f"{session['config']['canvas_api_url'].rstrip('/api/v1')}/api/v1{endpoint}"
-        
-        # Use secure SSL context
-        ssl_context = httpx.create_ssl_context()
-        ssl_context.check_hostname = True
-        ssl_context.verify_mode = 2  # ssl.CERT_REQUIRED
-        
-        async with httpx.AsyncClient(verify=ssl_context, timeout=30.0) as client:
-            try:
-                response = await client.get(url, headers=headers, params=params or {})
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    # Clear session on authentication failure
-                    session_manager.destroy_session(session_id)
-                return {"error": f"Canvas API error: {e.response.status_code} - {e.response.text}"}
-            except Exception as e:
-                return {"error": f"Request failed: {str(e)}"}
+        url = f"{session['config']['canvas_base_url']}/api/v1{endpoint}"
+
+        try:
+            response = await self._client.get(url, headers=headers, params=params or {})
+            response.raise_for_status()
+            # Parse the raw bytes - orjson is several times faster than the
+            # stdlib parser on large assignment/course payloads
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                # Clear session on authentication failure
+                session_manager.destroy_session(session_id)
+            return {"error": f"Canvas API error: {e.response.status_code} - {e.response.text}"}
+        except Exception as e:
+            return {"error": f"Request failed: {str(e)}"}
 
 # Global secure session manager
 session_manager = SecureSessionManager()
 
+# Global Canvas client - shared so the connection pool is reused across tools
+canvas_client = SecureCanvasClient()
+
 def create_server() -> FastMCP:
     """Create and configure the secure Canvas MCP server."""
     mcp = FastMCP("canvas-secure")
@@ -248,11 +298,20 @@ def register_all_tools(mcp: FastMCP) -> None:
         session = session_manager.get_session(session_id)
         
         # Encrypt token with session-specific key
-        encrypted_token = SecureTokenManager.encrypt_token(api_token, session['session_key'])
-        
+        encrypted_token = SecureTokenManager.encrypt_token(api_token, session['aesgcm'])
+
+        # Normalize the base URL once - str.rstrip('/api/v1') strips a
+        # character set, not a suffix, so it mangled URLs ending in those
+        # characters on every request. Drop any trailing slash before the
+        # suffix check so 'https://x.edu/api/v1/' normalizes too.
+        canvas_base_url = api_url.rstrip('/')
+        if canvas_base_url.endswith('/api/v1'):
+            canvas_base_url = canvas_base_url[:-7]
+
         config = {
             'encrypted_token': encrypted_token,
             'canvas_api_url': api_url,
+            'canvas_base_url': canvas_base_url,
             'institution_name': institution_name,
             'authenticated_at': datetime.now().isoformat()
         }
@@ -260,8 +319,7 @@ def register_all_tools(mcp: FastMCP) -> None:
         session_manager.update_session(session_id, config)
         
         # Test the connection
-        client = SecureCanvasClient()
-        test_result = await client.make_canvas_request("/users/self", session_id, session_manager)
+        test_result = await canvas_client.make_canvas_request("/users/self", session_id, session_manager)
         
         if "error" in test_result:
             session_manager.destroy_session(session_id)
@@ -279,17 +337,12 @@ def register_all_tools(mcp: FastMCP) -> None:
         Returns:
             Confirmation message about logout status
         """
-        # For simplicity, we'll clear the most recent session
-        # In a real implementation, you'd track the current session
-        with session_manager.session_lock:
-            if session_manager.sessions:
-                # Clear the most recent session
-                latest_session = max(session_manager.sessions.keys(), 
-                                  key=lambda x: session_manager.sessions[x]['last_activity'])
-                session_manager._destroy_session(latest_session)
-                return "✅ Logged out successfully. All authentication data securely cleared from memory."
-            else:
-                return "ℹ️ No active sessions found."
+        session_id = session_manager.current_session_id
+        if session_id and session_id in session_manager.sessions:
+            session_manager._destroy_session(session_id)
+            return "✅ Logged out successfully. All authentication data securely cleared from memory."
+        else:
+            return "ℹ️ No active sessions found."
     
     @mcp.tool()
     async def list_courses(include_concluded: bool = False) -> str:
@@ -304,26 +357,18 @@ def register_all_tools(mcp: FastMCP) -> None:
         Returns:
             Formatted list of courses with codes, names, and IDs
         """
-        # Find the most recent authenticated session
-        with session_manager.session_lock:
-            authenticated_sessions = [
-                (sid, session) for sid, session in session_manager.sessions.items()
-                if session.get('config')
-            ]
-            
-            if not authenticated_sessions:
-                return "❌ No authenticated session found. Please authenticate first using authenticate_canvas."
-            
-            # Use the most recent session
-            session_id, session = max(authenticated_sessions, 
-                                    key=lambda x: x[1]['last_activity'])
+        # Use the tracked current session - O(1) instead of scanning and
+        # max()-ing the whole session table on every tool call
+        session_id = session_manager.current_session_id
+        session = session_manager.get_session(session_id) if session_id else None
+        if not session or not session.get('config'):
+            return "❌ No authenticated session found. Please authenticate first using authenticate_canvas."
         
         params = {"enrollment_state": "active"}
         if include_concluded:
             params["enrollment_state"] = "all"
         
-        client = SecureCanvasClient()
-        result = await client.make_canvas_request("/courses", session_id, session_manager, params)
+        result = await canvas_client.make_canvas_request("/courses", session_id, session_manager, params)
         
         if "error" in result:
             return f"❌ Error: {result['error']}"
@@ -331,15 +376,17 @@ def register_all_tools(mcp: FastMCP) -> None:
         if not result:
             return "📚 No courses found."
         
-        courses_info = []
-        for course in result:
-            course_id = course.get("id")
-            name = course.get("name", "Unnamed course")
-            code = course.get("course_code", "No code")
-            state = course.get("workflow_state", "unknown")
-            courses_info.append(f"📖 Code: {code}\n   Name: {name}\n   ID: {course_id}\n   State: {state}\n")
-        
-        return f"📚 Courses ({len(result)} found):\n\n" + "\n".join(courses_info)
+        # Single %-formatted template per record, joined in one pass - the
+        # f-string-per-field version allocated several intermediates per course
+        return f"📚 Courses ({len(result)} found):\n\n" + "\n".join(
+            "📖 Code: %s\n   Name: %s\n   ID: %s\n   State: %s\n" % (
+                course.get("course_code", "No code"),
+                course.get("name", "Unnamed course"),
+                course.get("id"),
+                course.get("workflow_state", "unknown")
+            )
+            for course in result
+        )
     
     @mcp.tool()
     async def list_assignments(course_id: str) -> str:
@@ -354,22 +401,14 @@ def register_all_tools(mcp: FastMCP) -> None:
         Returns:
             Formatted list of assignments with details
         """
-        # Find the most recent authenticated session
-        with session_manager.session_lock:
-            authenticated_sessions = [
-                (sid, session) for sid, session in session_manager.sessions.items()
-                if session.get('config')
-            ]
-            
-            if not authenticated_sessions:
-                return "❌ No authenticated session found. Please authenticate first using authenticate_canvas."
-            
-            # Use the most recent session
-            session_id, session = max(authenticated_sessions, 
-                                    key=lambda x: x[1]['last_activity'])
+        # Use the tracked current session - O(1) instead of scanning and
+        # max()-ing the whole session table on every tool call
+        session_id = session_manager.current_session_id
+        session = session_manager.get_session(session_id) if session_id else None
+        if not session or not session.get('config'):
+            return "❌ No authenticated session found. Please authenticate first using authenticate_canvas."
         
-        client = SecureCanvasClient()
-        result = await client.make_canvas_request(f"/courses/{course_id}/assignments", session_id, session_manager)
+        result = await canvas_client.make_canvas_request(f"/courses/{course_id}/assignments", session_id, session_manager)
         
         if "error" in result:
             return f"❌ Error: {result['error']}"
@@ -377,17 +416,16 @@ def register_all_tools(mcp: FastMCP) -> None:
         if not result:
             return f"📝 No assignments found for course {course_id}."
         
-        assignments_info = []
-        for assignment in result:
-            assignment_id = assignment.get("id")
-            name = assignment.get("name", "Unnamed assignment")
-            due_at = assignment.get("due_at", "No due date")
-            points = assignment.get("points_possible", 0)
-            submission = assignment.get("has_submitted_submissions", False)
-            status = "✅ Submitted" if submission else "⏳ Pending"
-            assignments_info.append(f"📝 {name}\n   Due: {due_at}\n   Points: {points}\n   Status: {status}\n   ID: {assignment_id}\n")
-        
-        return f"📝 Assignments for Course {course_id} ({len(result)} found):\n\n" + "\n".join(assignments_info)
+        return f"📝 Assignments for Course {course_id} ({len(result)} found):\n\n" + "\n".join(
+            "📝 %s\n   Due: %s\n   Points: %s\n   Status: %s\n   ID: %s\n" % (
+                assignment.get("name", "Unnamed assignment"),
+                assignment.get("due_at", "No due date"),
+                assignment.get("points_possible", 0),
+                "✅ Submitted" if assignment.get("has_submitted_submissions", False) else "⏳ Pending",
+                assignment.get("id")
+            )
+            for assignment in result
+        )
     
     @mcp.tool()
     async def get_assignments_due_tomorrow() -> str:
@@ -399,61 +437,58 @@ def register_all_tools(mcp: FastMCP) -> None:
         Returns:
             Formatted list of assignments due tomorrow
         """
-        # Find the most recent authenticated session
-        with session_manager.session_lock:
-            authenticated_sessions = [
-                (sid, session) for sid, session in session_manager.sessions.items()
-                if session.get('config')
-            ]
-            
-            if not authenticated_sessions:
-                return "❌ No authenticated session found. Please authenticate first using authenticate_canvas."
-            
-            # Use the most recent session
-            session_id, session = max(authenticated_sessions, 
-                                    key=lambda x: x[1]['last_activity'])
+        # Use the tracked current session - O(1) instead of scanning and
+        # max()-ing the whole session table on every tool call
+        session_id = session_manager.current_session_id
+        session = session_manager.get_session(session_id) if session_id else None
+        if not session or not session.get('config'):
+            return "❌ No authenticated session found. Please authenticate first using authenticate_canvas."
         
         # Get tomorrow's date
         tomorrow = datetime.now() + timedelta(days=1)
         tomorrow_str = tomorrow.strftime("%Y-%m-%d")
         
-        client = SecureCanvasClient()
-        courses_result = await client.make_canvas_request("/courses", session_id, session_manager, {"enrollment_state": "active"})
+        courses_result = await canvas_client.make_canvas_request("/courses", session_id, session_manager, {"enrollment_state": "active"})
         
         if "error" in courses_result:
             return f"❌ Error: {courses_result['error']}"
         
         assignments_due = []
-        
-        # Check assignments for each course
-        for course in courses_result:
-            course_id = course.get("id")
-            if course_id:
-                assignments_result = await client.make_canvas_request(
-                    f"/courses/{course_id}/assignments",
-                    session_id, session_manager,
-                    {"bucket": "upcoming", "per_page": 100}
-                )
-                
-                if "error" not in assignments_result:
-                    for assignment in assignments_result:
-                        due_date = assignment.get("due_at")
-                        if due_date and due_date.startswith(tomorrow_str):
-                            assignment["course_name"] = course.get("name", "Unknown Course")
-                            assignments_due.append(assignment)
+
+        # Check assignments for all courses concurrently - the per-course
+        # requests are independent, so total latency is ~max instead of sum
+        courses_with_ids = [course for course in courses_result if course.get("id")]
+        tasks = [
+            canvas_client.make_canvas_request(
+                f"/courses/{course['id']}/assignments",
+                session_id, session_manager,
+                {"bucket": "upcoming", "per_page": 100}
+            )
+            for course in courses_with_ids
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for course, assignments_result in zip(courses_with_ids, results):
+            if isinstance(assignments_result, Exception) or "error" in assignments_result:
+                continue
+            for assignment in assignments_result:
+                due_date = assignment.get("due_at")
+                if due_date and due_date.startswith(tomorrow_str):
+                    assignment["course_name"] = course.get("name", "Unknown Course")
+                    assignments_due.append(assignment)
         
         if not assignments_due:
             return f"🎉 No assignments due tomorrow ({tomorrow_str}). You're all caught up!"
         
-        assignments_info = []
-        for assignment in assignments_due:
-            name = assignment.get("name", "Unnamed assignment")
-            course_name = assignment.get("course_name", "Unknown Course")
-            due_at = assignment.get("due_at", "No due date")
-            points = assignment.get("points_possible", 0)
-            assignments_info.append(f"📚 {course_name}\n   📝 {name}\n   ⏰ Due: {due_at}\n   📊 Points: {points}\n")
-        
-        return f"⏰ Assignments due tomorrow ({tomorrow_str}) - {len(assignments_due)} found:\n\n" + "\n".join(assignments_info)
+        return f"⏰ Assignments due tomorrow ({tomorrow_str}) - {len(assignments_due)} found:\n\n" + "\n".join(
+            "📚 %s\n   📝 %s\n   ⏰ Due: %s\n   📊 Points: %s\n" % (
+                assignment.get("course_name", "Unknown Course"),
+                assignment.get("name", "Unnamed assignment"),
+                assignment.get("due_at", "No due date"),
+                assignment.get("points_possible", 0)
+            )
+            for assignment in assignments_due
+        )
 
 def main():
     """Main entry point for the Secure Canvas MCP server."""
@@ -473,9 +508,10 @@ def main():
     except KeyboardInterrupt:
         print("\n🛑 Server stopped - clearing all sessions", file=sys.stderr)
         # Clear all sessions on exit
-        with session_manager.session_lock:
-            for session_id in list(session_manager.sessions.keys()):
-                session_manager._destroy_session(session_id)
+        for session_id in list(session_manager.sessions.keys()):
+            session_manager._destroy_session(session_id)
+        # Release pooled connections
+        asyncio.run(canvas_client.aclose())
 
 if __name__ == "__main__":
     main()
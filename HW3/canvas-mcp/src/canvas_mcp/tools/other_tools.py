@@ -365,7 +365,9 @@ def register_other_tools(mcp: FastMCP):
             module_name = module_response.get("name", "Unknown Module")
 
         course_display = await get_course_code(course_id) or course_identifier
-        result = f"Module Items for '{module_name}' in Course {course_display}:\n\n"
+        # Collect fragments and join once - += in the loop reallocates the
+        # whole string per append
+        parts = [f"Module Items for '{module_name}' in Course {course_display}:\n\n"]
 
         for item in items:
             item_id = item.get("id")
@@ -376,18 +378,18 @@ def register_other_tools(mcp: FastMCP):
             external_url = item.get("external_url", "")
             published = item.get("published", False)
 
-            result += f"Item: {title}\n"
-            result += f"Type: {item_type}\n"
-            result += f"ID: {item_id}\n"
+            parts.append(f"Item: {title}\n")
+            parts.append(f"Type: {item_type}\n")
+            parts.append(f"ID: {item_id}\n")
             if content_id:
-                result += f"Content ID: {content_id}\n"
+                parts.append(f"Content ID: {content_id}\n")
             if url:
-                result += f"URL: {url}\n"
+                parts.append(f"URL: {url}\n")
             if external_url:
-                result += f"External URL: {external_url}\n"
-            result += f"Published: {'Yes' if published else 'No'}\n\n"
+                parts.append(f"External URL: {external_url}\n")
+            parts.append(f"Published: {'Yes' if published else 'No'}\n\n")
 
-        return result
+        return "".join(parts)
 
     @mcp.tool()
     @validate_params
@@ -412,7 +414,9 @@ def register_other_tools(mcp: FastMCP):
 
         # Format the output
         course_display = await get_course_code(course_id) or course_identifier
-        output = f"Groups for Course {course_display}:\n\n"
+        # Collect fragments and join once - += in the loop reallocates the
+        # whole string per append
+        parts = [f"Groups for Course {course_display}:\n\n"]
 
         for group in groups:
             group_id = group.get("id")
@@ -420,10 +424,10 @@ def register_other_tools(mcp: FastMCP):
             group_category = group.get("group_category_id", "Uncategorized")
             member_count = group.get("members_count", 0)
 
-            output += f"Group: {group_name}\n"
-            output += f"ID: {group_id}\n"
-            output += f"Category ID: {group_category}\n"
-            output += f"Member Count: {member_count}\n"
+            parts.append(f"Group: {group_name}\n")
+            parts.append(f"ID: {group_id}\n")
+            parts.append(f"Category ID: {group_category}\n")
+            parts.append(f"Member Count: {member_count}\n")
 
             # Get members for this group
             members = await fetch_all_paginated_results(
@@ -431,9 +435,9 @@ def register_other_tools(mcp: FastMCP):
             )
 
             if isinstance(members, dict) and "error" in members:
-                output += f"Error fetching members: {members['error']}\n"
+                parts.append(f"Error fetching members: {members['error']}\n")
             elif not members:
-                output += "No members in this group.\n"
+                parts.append("No members in this group.\n")
             else:
                 # Anonymize member data to protect student privacy
                 try:
@@ -441,16 +445,16 @@ def register_other_tools(mcp: FastMCP):
                 except Exception as e:
                     print(f"Warning: Failed to anonymize group member data: {str(e)}")
                     # Continue with original data for functionality
-                output += "Members:\n"
+                parts.append("Members:\n")
                 for member in members:
                     member_id = member.get("id")
                     member_name = member.get("name", "Unnamed user")
                     member_email = member.get("email", "No email")
-                    output += f"  - {member_name} (ID: {member_id}, Email: {member_email})\n"
+                    parts.append(f"  - {member_name} (ID: {member_id}, Email: {member_email})\n")
 
-            output += "\n"
+            parts.append("\n")
 
-        return output
+        return "".join(parts)
 
     # ===== USER TOOLS =====
 
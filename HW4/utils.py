@@ -1,30 +1,44 @@
 import os
+import io
 import json
-import tempfile
 import time
 from datetime import datetime
 from IPython.display import Audio, display
 import ipywidgets as widgets
 from openai import OpenAI
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def get_openai_api_key():
     key = os.getenv("OPENAI_API_KEY")
     if not key:
         raise ValueError("OPENAI_API_KEY not found in environment variables.")
     return key
 
+@lru_cache(maxsize=None)
 def get_serper_api_key():
     key = os.getenv("SERPER_API_KEY")
     if not key:
         raise ValueError("SERPER_API_KEY not found in environment variables.")
     return key
 
+@lru_cache(maxsize=None)
 def get_openai_model_name():
     key = os.getenv("OPENAI_MODEL_NAME")
     if not key:
         raise ValueError("OPENAI_MODEL_NAME not found in environment variables.")
     return key
 
+_OPENAI_CLIENT = None
+
+def _get_openai_client():
+    """Shared OpenAI client - constructing one builds a fresh HTTP client,
+    so reuse a single instance and keep connections alive across calls"""
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        _OPENAI_CLIENT = OpenAI(api_key=get_openai_api_key())
+    return _OPENAI_CLIENT
+
 def pretty_print_result(result):
     import json
     print(json.dumps(result, indent=2))
@@ -73,24 +87,20 @@ def transcribe_audio(audio_data, language="en"):
     """Transcribe audio using OpenAI Whisper API"""
     try:
         import sys
-        client = OpenAI(api_key=get_openai_api_key())
+        client = _get_openai_client()
         
-        # Save audio data to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_file.write(audio_data)
-            temp_file_path = temp_file.name
+        # Pass the audio straight from memory - no temp-file round trip.
+        # The .name attribute is what the SDK uses to infer the MIME type.
+        audio_file = io.BytesIO(audio_data)
+        audio_file.name = "audio.mp3"
         
         # Transcribe using Whisper with language specification
-        with open(temp_file_path, "rb") as audio_file:
-            transcript = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=language,  # Force English transcription
-                response_format="text"  # Get plain text, not JSON
-            )
-        
-        # Clean up temporary file
-        os.unlink(temp_file_path)
+        transcript = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_file,
+            language=language,  # Force English transcription
+            response_format="text"  # Get plain text, not JSON
+        )
         
         return transcript.strip()
         
@@ -104,7 +114,7 @@ def text_to_speech(text, voice="alloy"):
     """Convert text to speech using OpenAI TTS API"""
     try:
         import sys
-        client = OpenAI(api_key=get_openai_api_key())
+        client = _get_openai_client()
         
         # Generate speech
         response = client.audio.speech.create(